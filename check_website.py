@@ -1,38 +1,163 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import json
+import os
+import time
+from html.parser import HTMLParser
+
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from config_manager import atomic_write_bytes, get_app_data_directory
+
+# Shared session so repeated checks reuse the pooled keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip'
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=10))
+
+# The holiday page changes rarely, so a fetched copy is reused for a day
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class _TableComplete(Exception):
+    """Raised by the parser once enough table rows have been collected."""
+
+
+class _CountryTableParser(HTMLParser):
+    """Single-pass tokenizer that collects cell texts from the country holiday table.
+
+    Tracks only whether it is inside the table, a row and a cell, so no document
+    tree is built and only the kept rows are held in memory.
+    """
+
+    def __init__(self, limit=10):
+        super().__init__()
+        self.limit = limit
+        self.rows = []
+        self._in_table = False
+        self._row = None
+        self._cell = None
+
+    def _end_cell(self):
+        if self._cell is not None:
+            self._row.append(''.join(self._cell).strip())
+            self._cell = None
+
+    def _end_row(self):
+        self._end_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+            if len(self.rows) >= self.limit:
+                raise _TableComplete
+
+    def handle_starttag(self, tag, attrs):
+        if not self._in_table:
+            if tag == 'table':
+                classes = (dict(attrs).get('class') or '').split()
+                self._in_table = 'country-table' in classes
+        elif tag == 'tr':
+            self._end_row()
+            self._row = []
+        elif tag == 'td' and self._row is not None:
+            self._end_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if not self._in_table:
+            return
+        if tag == 'td':
+            self._end_cell()
+        elif tag == 'tr':
+            self._end_row()
+        elif tag == 'table':
+            self._end_row()
+            raise _TableComplete
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def _read_table_rows(html, limit=10):
+    """Run the tokenizer over the page and return the first table rows.
+
+    Parsing stops as soon as `limit` rows of the country table have been seen,
+    so the rest of the page is never tokenized.
+    """
+    parser = _CountryTableParser(limit)
+
+    try:
+        parser.feed(html)
+    except _TableComplete:
+        pass
+
+    return parser.rows
+
+
+def _fetch_page(url):
+    """Return the raw page HTML, memoized on disk with a TTL.
+
+    A fresh cached copy is returned without touching the network. Once stale, the
+    stored ETag/Last-Modified validators are sent so the server can answer with a
+    cheap 304 Not Modified instead of the full body.
+    """
+    cache_path = get_app_data_directory() / 'officeholidays.html'
+    validators_path = cache_path.with_suffix('.etag')
+
+    try:
+        if time.time() - cache_path.stat().st_mtime < CACHE_TTL_SECONDS:
+            return cache_path.read_bytes()
+        validators = json.loads(validators_path.read_text())
+    except (OSError, ValueError):
+        validators = {}
+
+    headers = {}
+    if 'ETag' in validators:
+        headers['If-None-Match'] = validators['ETag']
+    if 'Last-Modified' in validators:
+        headers['If-Modified-Since'] = validators['Last-Modified']
+
+    response = _SESSION.get(url, headers=headers, timeout=10)
+    if response.status_code == 304:
+        # Cached copy is still current, restart its TTL
+        os.utime(cache_path)
+        return cache_path.read_bytes()
+    response.raise_for_status()
+
+    atomic_write_bytes(cache_path, response.content)
+    validators = {key: response.headers[key] for key in ('ETag', 'Last-Modified')
+                  if key in response.headers}
+    validators_path.write_text(json.dumps(validators))
+
+    return response.content
 
 
 def check_website_structure():
     url = "https://www.officeholidays.com/countries/malaysia"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', class_='country-table')
+        html = _fetch_page(url).decode('utf-8', errors='replace')
+        rows = _read_table_rows(html)
 
-        if not table:
+        if not rows:
             print("Could not find holiday table on the website")
             return
 
-        rows = table.find_all('tr')[1:10]  # Get first few rows for analysis
+        rows = rows[1:10]  # Get first few rows for analysis
 
         print("Sample holiday data from website:")
         print("-" * 60)
 
-        for row in rows:
-            cols = row.find_all('td')
+        for cols in rows:
             if len(cols) >= 3:
-                date_str = cols[0].get_text(strip=True)
-                day = cols[1].get_text(strip=True)
-                name = cols[2].get_text(strip=True)
+                date_str = cols[0]
+                day = cols[1]
+                name = cols[2]
 
                 print(f"Date text: '{date_str}'")
                 print(f"Day: '{day}'")
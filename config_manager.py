@@ -6,20 +6,56 @@ Configuration Manager for Malaysia Holiday Notifier
 Handles reading and writing application configuration settings.
 """
 
+import functools
 import json
 import os
 import sys
 import tempfile
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def atomic_write_bytes(path, data: bytes) -> None:
+    """Write a file through a temporary file, so a crash never leaves it half-written.
+
+    Args:
+        path (Union[str, Path]): File to write
+        data (bytes): New file content
+    """
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to JSON bytes, with orjson when it is installed.
+
+    Args:
+        obj (Any): JSON-serializable object
+        indent (bool): Indent the output by two spaces
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=None)
 def get_app_data_directory():
     """Get the appropriate directory for application data based on the platform.
+
+    The result is cached, so the directory is resolved and created once per process.
     
     Returns:
         Path: Path object for the app data directory
@@ -28,17 +64,12 @@ def get_app_data_directory():
     app_name = "MalaysiaHolidayNotifier"
     
     if hasattr(sys, 'frozen'):
-        # Running as compiled executable
-        try:
-            # First try to use user's AppData directory
-            appdata_path = os.environ.get('LOCALAPPDATA')
-            if appdata_path:
-                app_dir = Path(appdata_path) / app_name
-            else:
-                # Fallback to temp directory if LOCALAPPDATA is not available
-                app_dir = Path(tempfile.gettempdir()) / app_name
-        except Exception:
-            # Final fallback to temp directory
+        # Running as compiled executable, prefer the user's AppData directory
+        appdata_path = os.environ.get('LOCALAPPDATA')
+        if appdata_path:
+            app_dir = Path(appdata_path) / app_name
+        else:
+            # Fallback to temp directory if LOCALAPPDATA is not available
             app_dir = Path(tempfile.gettempdir()) / app_name
     else:
         # Running as script - use current directory
@@ -53,6 +84,10 @@ def get_app_data_directory():
 class ConfigManager:
     """Class responsible for managing application configuration."""
 
+    # Parsed configuration shared by all instances, keyed by file path:
+    # ((mtime in ns, size), config). The size catches edits within a coarse mtime tick
+    _cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
     def __init__(self, config_file: str = "app_config.json"):
         """
         Initialize the configuration manager.
@@ -78,25 +113,38 @@ class ConfigManager:
             "notification_days_ahead": 7
         }
 
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    # Ensure all default keys exist
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
-            except json.JSONDecodeError:
-                logger.error(f"Error decoding {self.config_file}, using default configuration")
-                return default_config
-        return default_config
+        # A single open both checks existence and gives the file stats for the cache lookup
+        try:
+            with open(self.config_file, 'rb') as f:
+                st = os.fstat(f.fileno())
+                signature = (st.st_mtime_ns, st.st_size)
+
+                # Reuse the parsed configuration if the file hasn't changed since last read
+                cached = self._cache.get(self.config_file)
+                if cached and cached[0] == signature:
+                    return dict(cached[1])
+
+                data = f.read()
+        except FileNotFoundError:
+            return default_config
+
+        try:
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError:
+            logger.error(f"Error decoding {self.config_file}, using default configuration")
+            return default_config
+
+        # Ensure all default keys exist
+        config = {**default_config, **config}
+        self._cache[self.config_file] = (signature, dict(config))
+        return config
 
     def save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file atomically."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            atomic_write_bytes(self.config_file, dumps_json(self.config, indent=True))
+            st = os.stat(self.config_file)
+            self._cache[self.config_file] = ((st.st_mtime_ns, st.st_size), dict(self.config))
             logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Error saving configuration: {str(e)}")
@@ -114,13 +162,26 @@ class ConfigManager:
         """
         return self.config.get(key, default)
 
-    def set_setting(self, key: str, value: Any) -> None:
+    def set_setting(self, key: str, value: Any, autosave: bool = True) -> None:
         """
         Set a configuration setting.
 
         Args:
             key (str): Setting key
             value (Any): Setting value
+            autosave (bool): Write the configuration to file immediately. Pass False
+                when updating several settings and call save_config() once afterwards.
         """
         self.config[key] = value
+        if autosave:
+            self.save_config()
+
+    def set_settings(self, settings: Mapping[str, Any]) -> None:
+        """
+        Set several configuration settings with a single write.
+
+        Args:
+            settings (Mapping[str, Any]): Setting keys and values
+        """
+        self.config.update(settings)
         self.save_config()
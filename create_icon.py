@@ -8,8 +8,8 @@ accurately representing elements of the Malaysian flag.
 """
 
 import os
-import math
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 
@@ -30,16 +30,18 @@ def create_icon(output_png_path="icon.png", output_ico_path="icon.ico", size=128
     red = (206, 17, 38, 255)  # Red
 
     # Draw alternating stripes (Malaysian flag has 14 stripes)
+    # Build a 1-pixel-wide column of stripe colors and upscale it in a single call
     stripe_height = size // 14
     white = (255, 255, 255, 255)
-    for i in range(14):
-        color = red if i % 2 == 0 else white
-        draw.rectangle([(0, i * stripe_height), (size, (i + 1) * stripe_height)], fill=color)
+    stripe_colors = np.where(np.arange(14)[:, None, None] % 2 == 0, red, white).astype(np.uint8)
+    stripes = Image.fromarray(stripe_colors, 'RGBA').resize((size, stripe_height * 14),
+                                                            Image.NEAREST)
+    img.paste(stripes, (0, 0))
 
     # Draw blue rectangle in top left (canton)
     canton_width = size // 2
     canton_height = size // 2
-    draw.rectangle([(0, 0), (canton_width, canton_height)], fill=blue)
+    img.paste(blue, (0, 0, canton_width + 1, canton_height + 1))
 
     # Draw a 14-point star in the blue canton
     # Calculate star points
@@ -49,17 +51,14 @@ def create_icon(output_png_path="icon.png", output_ico_path="icon.ico", size=128
     inner_radius = outer_radius // 2
     num_points = 14
     
-    star_points = []
-    for i in range(num_points * 2):
-        # Alternate between outer and inner points
-        radius = outer_radius if i % 2 == 0 else inner_radius
-        # Calculate angle (in radians)
-        angle = (i * 2 * 3.14159) / (num_points * 2)
-        
-        x = star_center_x + int(radius * math.cos(angle))
-        y = star_center_y + int(radius * math.sin(angle))
-        star_points.append((x, y))
-    
+    # Alternate between outer and inner points, computing all angles in one pass
+    steps = np.arange(num_points * 2)
+    angles = steps * (np.pi / num_points)
+    radii = np.where(steps % 2 == 0, outer_radius, inner_radius)
+    xs = star_center_x + (radii * np.cos(angles)).astype(int)
+    ys = star_center_y + (radii * np.sin(angles)).astype(int)
+    star_points = list(zip(xs.tolist(), ys.tolist()))
+
     # Draw the star
     draw.polygon(star_points, fill=(255, 255, 0, 255))
 
@@ -68,34 +67,39 @@ def create_icon(output_png_path="icon.png", output_ico_path="icon.ico", size=128
     calendar_x = size - calendar_size - size // 10
     calendar_y = size - calendar_size - size // 10
 
+    # Build the whole calendar as one RGBA array (rectangle bounds are inclusive,
+    # hence the extra pixel) and composite it onto the icon in a single call
+    black = (0, 0, 0, 255)
+    cal_extent = calendar_size + 1
+    border = size // 50
+    bar_height = calendar_size // 5 + 1
+
     # Calendar background
-    draw.rectangle(
-        [(calendar_x, calendar_y),
-         (calendar_x + calendar_size, calendar_y + calendar_size)],
-        fill=(255, 255, 255, 255),
-        outline=(0, 0, 0, 255),
-        width=size//50
-    )
+    cal = np.full((cal_extent, cal_extent, 4), 255, dtype=np.uint8)
 
     # Calendar top bar
-    draw.rectangle(
-        [(calendar_x, calendar_y),
-         (calendar_x + calendar_size, calendar_y + calendar_size//5)],
-        fill=red,
-        outline=(0, 0, 0, 255),
-        width=size//50
-    )
-
-    # Calendar lines
+    cal[:bar_height] = red
+
+    # Calendar border, including the outline under the top bar
+    if border:
+        cal[:border] = black
+        cal[-border:] = black
+        cal[:, :border] = black
+        cal[:, -border:] = black
+        cal[bar_height - border:bar_height] = black
+
+    # Calendar lines, like Pillow a zero width draws nothing and a wide line extends
+    # (width - 1) // 2 rows above its y
     line_spacing = calendar_size // 4
-    for i in range(1, 3):
-        y = calendar_y + calendar_size//5 + i * line_spacing
-        draw.line(
-            [(calendar_x + calendar_size//10, y),
-             (calendar_x + calendar_size - calendar_size//10, y)],
-            fill=(0, 0, 0, 255),
-            width=size//100
-        )
+    line_width = size // 100
+    line_start = calendar_size // 10
+    line_end = calendar_size - calendar_size // 10 + 1
+    if line_width:
+        for i in range(1, 3):
+            y = calendar_size // 5 + i * line_spacing - (line_width - 1) // 2
+            cal[y:y + line_width, line_start:line_end] = black
+
+    img.alpha_composite(Image.fromarray(cal, 'RGBA'), dest=(calendar_x, calendar_y))
 
     # Save as PNG
     img.save(output_png_path)
@@ -105,16 +109,11 @@ def create_icon(output_png_path="icon.png", output_ico_path="icon.ico", size=128
     try:
         # ICO format requires sizes to be powers of 2
         ico_sizes = [16, 32, 48, 64, 128, 256]
-        ico_images = []
-        
-        # Create versions at different sizes for the ICO file
-        for ico_size in ico_sizes:
-            if ico_size <= size:  # Only include sizes up to the original size
-                resized_img = img.resize((ico_size, ico_size), Image.LANCZOS)
-                ico_images.append(resized_img)
-        
-        # Save as ICO with multiple sizes
-        img.save(output_ico_path, format='ICO', sizes=[(i.width, i.height) for i in ico_images])
+
+        # Save as ICO with multiple sizes, Pillow downscales from the master image itself
+        # Only include sizes up to the original size
+        img.save(output_ico_path, format='ICO',
+                 sizes=[(s, s) for s in ico_sizes if s <= size])
         print(f"ICO icon created at {output_ico_path}")
     except Exception as e:
         print(f"Error creating ICO file: {e}")
@@ -9,82 +9,116 @@ Script to automatically fix common style issues in Python files:
 
 import os
 import sys
-import re
 import subprocess
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-def fix_trailing_whitespace(file_path):
-    """Remove trailing whitespace from all lines in a file."""
-    print(f"Fixing trailing whitespace in {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-    
+# Line prefixes for top-level definitions, checked with bytes.startswith instead of regexes
+CLASS_PREFIXES = (b'class ', b'class\t')
+DEF_PREFIXES = (b'def ', b'def\t')
+DEFINITION_PREFIXES = CLASS_PREFIXES + DEF_PREFIXES
+TOP_LEVEL_PREFIXES = DEFINITION_PREFIXES + (b'@',)
+
+# Directories that never contain project sources and are not descended into
+SKIP_DIRS = {'.git', '.venv', 'venv', '__pycache__', 'build', 'dist', '.mypy_cache'}
+
+def detect_newline(content):
+    """Return the newline sequence used by the given source bytes."""
+    return b'\r\n' if b'\r\n' in content else b'\n'
+
+def fix_trailing_whitespace(content):
+    """Remove trailing whitespace from all lines of the given source bytes.
+
+    Works on raw bytes: spaces and tabs are ASCII and never occur inside multi-byte
+    UTF-8 sequences, so no decode/encode round-trip is needed.
+    """
+    newline = detect_newline(content)
     # Remove trailing whitespace from each line
-    fixed_content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)
-    
-    with open(file_path, 'w', encoding='utf-8') as file:
-        file.write(fixed_content)
-
-def ensure_blank_lines(file_path):
-    """Ensure proper blank lines between functions and classes."""
-    print(f"Fixing blank lines in {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-    
+    fixed_content = newline.join(line.rstrip(b' \t') for line in content.splitlines())
+    if content.endswith((b'\n', b'\r')):
+        fixed_content += newline
+    return fixed_content
+
+def ensure_blank_lines(content):
+    """Ensure proper blank lines between functions and classes in the given source bytes.
+
+    Single pass over the lines that only tracks the current run of blank lines and
+    whether the previous code line was a decorator, so no line is looked at twice.
+    """
+    newline = detect_newline(content)
     result = []
-    in_class_or_func = False
     blank_lines_count = 0
+    after_decorator = False
     
-    for i, line in enumerate(lines):
-        # Check for class or function definition
-        if re.match(r'^(class|def)\s+', line) and i > 0:
-            # If we're starting a new class or top-level function, ensure 2 blank lines before
-            if not in_class_or_func or re.match(r'^class\s+', line) or re.match(r'^def\s+', lines[i-blank_lines_count-1]):
-                # Ensure exactly 2 blank lines before class/function definitions
-                while blank_lines_count < 2:
-                    result.append('\n')
-                    blank_lines_count += 1
-            in_class_or_func = True
+    for line in content.splitlines(keepends=True):
+        # Ensure at least 2 blank lines before top-level class/function definitions and
+        # their decorators, unless at the start of the file or directly after a decorator
+        if line.startswith(TOP_LEVEL_PREFIXES) and result and not after_decorator:
+            while blank_lines_count < 2:
+                result.append(newline)
+                blank_lines_count += 1
         
+        result.append(line)
+
         # Count consecutive blank lines
-        if line.strip() == '':
+        if line.strip() == b'':
             blank_lines_count += 1
         else:
             blank_lines_count = 0
-        
-        result.append(line)
+            after_decorator = line.startswith(b'@')
     
-    with open(file_path, 'w', encoding='utf-8') as file:
-        file.writelines(result)
+    return b''.join(result)
+
+def process_file(file_path):
+    """Read a file, fix whitespace and blank lines, and write it back."""
+    print(f"Fixing trailing whitespace and blank lines in {file_path}")
+    with open(file_path, 'rb') as file:
+        content = file.read()
+
+    content = ensure_blank_lines(fix_trailing_whitespace(content))
+
+    with open(file_path, 'wb') as file:
+        file.write(content)
+    return file_path
+
+def iter_python_files(top='.'):
+    """Yield paths of Python files under top, pruning directories in SKIP_DIRS."""
+    for root, dirs, files in os.walk(top):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if name.endswith('.py'):
+                yield os.path.join(root, name)
 
 def main():
     """Main function to fix style issues in Python files."""
     # Get all Python files in the project
-    python_files = list(Path('.').glob('**/*.py'))
-    
-    for file_path in python_files:
+    paths = [
+        file_path for file_path in iter_python_files()
         # Skip this script itself
-        if file_path.name == os.path.basename(__file__):
-            continue
-            
-        str_path = str(file_path)
-        fix_trailing_whitespace(str_path)
-        ensure_blank_lines(str_path)
-        
-        # Try to run autoflake if available (removes unused imports)
-        try:
-            subprocess.run(['autoflake', '--in-place', '--remove-all-unused-imports', str_path], 
-                          check=True, capture_output=True)
-            print(f"Removed unused imports in {str_path}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Note: autoflake not available. Install with 'pip install autoflake' to remove unused imports")
-        
-        # Try to run isort if available (sorts imports)
-        try:
-            subprocess.run(['isort', str_path], check=True, capture_output=True)
-            print(f"Sorted imports in {str_path}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Note: isort not available. Install with 'pip install isort' to sort imports")
+        if os.path.basename(file_path) != os.path.basename(__file__)
+    ]
+
+    # Files are independent, so fix them in parallel across all cores
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(process_file, paths, chunksize=8))
+
+    if not paths:
+        return
+
+    # Run each tool once over all files so interpreter startup is paid only once
+    # Try to run autoflake if available (removes unused imports)
+    try:
+        subprocess.run(['autoflake', '--in-place', '--remove-all-unused-imports', *paths], 
+                      check=True, capture_output=True)
+        print(f"Removed unused imports in {len(paths)} files")
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("Note: autoflake not available. Install with 'pip install autoflake' to remove unused imports")
+    
+    # Try to run isort if available (sorts imports)
+    try:
+        subprocess.run(['isort', *paths], check=True, capture_output=True)
+        print(f"Sorted imports in {len(paths)} files")
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("Note: isort not available. Install with 'pip install isort' to sort imports")
 
 if __name__ == "__main__":
     main()
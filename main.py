@@ -7,18 +7,22 @@ A PyQt5 desktop application that runs in the background and displays Windows not
 for Malaysia holidays by scraping officeholidays.com.
 """
 
+import bisect
+import functools
 import json
 import logging
+import logging.handlers
 import os
 import sys
 import tempfile
-from datetime import datetime, timedelta
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import requests
-from bs4 import BeautifulSoup
-from PyQt5.QtCore import QObject, Qt, QTimer
+from PyQt5.QtCore import (QObject, QRunnable, QSignalBlocker, Qt, QThreadPool, QTimer,
+                          pyqtSignal)
 from PyQt5.QtGui import QColor, QFont, QIcon
 from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame, QHBoxLayout, 
                              QLabel, QListWidget, QListWidgetItem, QMainWindow,
@@ -26,7 +30,7 @@ from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame, QHBoxLa
                              QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
 
 # Import custom modules
-from config_manager import ConfigManager
+from config_manager import ConfigManager, atomic_write_bytes, dumps_json
 from startup_manager import StartupManager
 
 # Get appropriate directory for log files
@@ -61,33 +65,63 @@ def get_log_directory():
     
     return log_dir
 
-# Configure logging
+# Configure logging, only once even if this module is imported again
 log_file = get_log_directory() / "holiday_notifier.log"
-try:
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-    logger = logging.getLogger(__name__)
-    logger.info(f"Log file initialized at: {log_file}")
-except Exception as e:
-    # If logging to file fails, set up console-only logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler()]
-    )
-    logger = logging.getLogger(__name__)
-    logger.error(f"Failed to initialize log file: {e}")
+logger = logging.getLogger(__name__)
+if not logging.getLogger().handlers:
+    try:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                # Rotate to bound disk usage, the file is opened here so an unwritable
+                # log directory falls back to console-only logging below
+                logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=1_000_000, backupCount=3
+                ),
+                logging.StreamHandler()
+            ]
+        )
+        logger.info(f"Log file initialized at: {log_file}")
+    except Exception as e:
+        # If logging to file fails, set up console-only logging
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[logging.StreamHandler()]
+        )
+        logger.error(f"Failed to initialize log file: {e}")
+
+
+# Exit code of --self-test when the main window can't be built, success exits with 0
+SELF_TEST_FAILED = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _get_row_xpath():
+    """Compile the holiday table row XPath on first use.
+
+    lxml is imported here rather than at module level so the main window can paint
+    before the scraping libraries are loaded.
+
+    Returns:
+        lxml.etree.XPath: Selects all rows of the holiday table (first row is the header)
+    """
+    from lxml import etree
+    return etree.XPath('(//table[contains(@class, "country-table")])[1]//tr')
 
 
 class HolidayScraper(QObject):
     """Class responsible for scraping holiday data from the website."""
 
+    # Month abbreviations as shown on the website, avoids locale-dependent strptime('%b')
+    _MONTH_ABBR = {
+        abbr: num for num, abbr in enumerate(
+            ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1
+        )
+    }
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.officeholidays.com/countries/malaysia"
@@ -96,6 +130,85 @@ class HolidayScraper(QObject):
         }
         self.current_year = datetime.now().year
         self.next_year = self.current_year + 1
+        # Created on the first scrape, see _get_session()
+        self.session = None
+
+    def _get_session(self):
+        """
+        Get the HTTP session, creating it on first use.
+
+        requests is imported here so its import cost is paid on the first scrape, after
+        the main window has painted, rather than at application startup.
+
+        Returns:
+            requests.Session: Session shared by all scrapes
+        """
+        if self.session is None:
+            import requests
+            try:
+                from requests_cache import CachedSession
+            except ImportError:  # requests-cache is optional, fall back to an uncached session
+                CachedSession = None
+
+            # Session keeps connections alive between requests to the same host. Holiday tables
+            # change at most once a year, so responses are cached on disk for a week when possible
+            if CachedSession is not None:
+                session = CachedSession(
+                    str(get_log_directory() / 'http_cache'),
+                    expire_after=timedelta(days=7),
+                    allowable_codes=[200]
+                )
+            else:
+                session = requests.Session()
+            # Set the headers once on the session instead of rebuilding them per request
+            session.headers.update(self.headers)
+            self.session = session
+        return self.session
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_date(date_str: str, year: int) -> date:
+        """
+        Parse a website date such as 'Jan 01' for the given year.
+
+        Results are memoized, the daily re-check sees the same date strings every time.
+
+        Args:
+            date_str (str): Date text in 'MMM DD' format
+            year (int): Year the date belongs to
+
+        Returns:
+            date: Parsed date
+
+        Raises:
+            KeyError: If the month abbreviation is unknown
+            ValueError: If the text is malformed or the day is out of range
+        """
+        month_str, day_str = date_str.split()
+        return date(year, HolidayScraper._MONTH_ABBR[month_str], int(day_str))
+
+    def _fetch_document(self, url: str):
+        """
+        Download a page and parse it while the body streams in.
+
+        Chunks are fed to lxml as they arrive. This only avoids buffering the body with
+        the plain requests.Session fallback: requests-cache reads the whole body to store
+        it on a cache miss. iter_content works the same for cached responses.
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            lxml.html.HtmlElement: Root element of the parsed page
+        """
+        import lxml.html
+
+        with self._get_session().get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            parser = lxml.html.HTMLParser()
+            for chunk in response.iter_content(chunk_size=32768):
+                parser.feed(chunk)
+            return parser.close()
 
     def scrape_holidays(self) -> List[Dict[str, str]]:
         """
@@ -104,15 +217,28 @@ class HolidayScraper(QObject):
         Returns:
             List[Dict[str, str]]: List of holiday dictionaries with date, name, and day.
         """
+        # Follow the year rollover for a long-running application, the session is kept
+        current_year = datetime.now().year
+        if current_year != self.current_year:
+            self.current_year = current_year
+            self.next_year = current_year + 1
+
         try:
-            # Scrape current year holidays
-            current_year_holidays = self._scrape_year_holidays(self.current_year)
-            
-            # Scrape next year holidays
-            next_year_holidays = self._scrape_year_holidays(self.next_year)
-            
-            # Combine both years' holidays
-            all_holidays = current_year_holidays + next_year_holidays
+            # Create the shared session before the worker threads use it
+            self._get_session()
+
+            # Scrape current and next year holidays concurrently, both are I/O bound
+            years = [self.current_year, self.next_year]
+            all_holidays = []
+            with ThreadPoolExecutor(max_workers=len(years)) as executor:
+                futures = [executor.submit(self._scrape_year_holidays, year) for year in years]
+                
+                # Combine both years' holidays, one year failing doesn't discard the other
+                for year, future in zip(years, futures):
+                    try:
+                        all_holidays.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"Failed to fetch holidays for year {year}: {str(e)}")
             
             logger.info(f"Successfully scraped {len(all_holidays)} holidays for {self.current_year} and {self.next_year}")
             return all_holidays
@@ -135,44 +261,40 @@ class HolidayScraper(QObject):
         holidays = []
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = self._fetch_document(url)
             
             # Find holiday table rows
-            table = soup.find('table', class_='country-table')
-            if not table:
+            rows = _get_row_xpath()(doc)
+            if not rows:
                 # Try the main URL if year-specific URL doesn't work
                 if year == self.current_year:
                     return self._scrape_main_page_holidays()
                 logger.warning(f"Could not find holiday table for year {year}")
                 return []
 
-            rows = table.find_all('tr')[1:]  # Skip header row
-
-            for row in rows:
-                cols = row.find_all('td')
+            for row in rows[1:]:  # Skip header row
+                cols = row.findall('td')
                 if len(cols) >= 3:
                     # Website format: day of week is in first column, date is in second
-                    day_of_week = cols[0].get_text(strip=True)  # e.g., 'Monday'
-                    date_str = cols[1].get_text(strip=True)     # e.g., 'Jan 01'
-                    name = cols[2].get_text(strip=True)
+                    day_of_week, date_str, name = (
+                        col.text_content().strip() for col in cols[:3]
+                    )  # e.g., 'Monday', 'Jan 01', holiday name
 
                     # Parse date (format: 'MMM DD')
                     try:
-                        # Add the year to the date string
-                        full_date_str = f"{date_str} {year}"
-                        date_obj = datetime.strptime(full_date_str, '%b %d %Y')
+                        date_obj = self._parse_date(date_str, year)
 
                         holidays.append({
-                            'date': date_obj.strftime('%Y-%m-%d'),
+                            'date': date_obj.isoformat(),
+                            'date_obj': date_obj,  # Parsed once, reused by all consumers
+                            'ordinal': date_obj.toordinal(),  # Day number for integer date math
+                            'day_num': date_obj.day,
                             'name': name,
                             'day': day_of_week,
                             'month': date_obj.month,  # Add month for easier filtering
                             'year': year  # Add year for easier filtering
                         })
-                    except ValueError:
+                    except (KeyError, ValueError):
                         logger.warning(f"Could not parse date: {date_str} for year {year}")
                         continue
 
@@ -190,47 +312,46 @@ class HolidayScraper(QObject):
             List[Dict[str, str]]: List of holiday dictionaries
         """
         try:
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = self._fetch_document(self.base_url)
             holidays = []
 
             # Find holiday table rows
-            table = soup.find('table', class_='country-table')
-            if not table:
+            rows = _get_row_xpath()(doc)
+            if not rows:
                 logger.warning("Could not find holiday table on the website")
                 return []
 
-            rows = table.find_all('tr')[1:]  # Skip header row
-            current_year = datetime.now().year
+            today = date.today()
+            current_year = today.year
 
-            for row in rows:
-                cols = row.find_all('td')
+            for row in rows[1:]:  # Skip header row
+                cols = row.findall('td')
                 if len(cols) >= 3:
                     # Website format has changed: day of week is in first column, date is in second
-                    day_of_week = cols[0].get_text(strip=True)  # e.g., 'Monday'
-                    date_str = cols[1].get_text(strip=True)     # e.g., 'Jan 01'
-                    name = cols[2].get_text(strip=True)
+                    day_of_week, date_str, name = (
+                        col.text_content().strip() for col in cols[:3]
+                    )  # e.g., 'Monday', 'Jan 01', holiday name
 
                     # Parse date (format: 'MMM DD')
                     try:
-                        # Add the current year to the date string
-                        full_date_str = f"{date_str} {current_year}"
-                        date_obj = datetime.strptime(full_date_str, '%b %d %Y')
+                        # Parse using the current year
+                        date_obj = self._parse_date(date_str, current_year)
 
                         # If the date is in the past (more than 6 months ago), it's likely for next year
-                        if (datetime.now() - date_obj).days > 180:
+                        if (today - date_obj).days > 180:
                             date_obj = date_obj.replace(year=current_year + 1)
 
                         holidays.append({
-                            'date': date_obj.strftime('%Y-%m-%d'),
+                            'date': date_obj.isoformat(),
+                            'date_obj': date_obj,  # Parsed once, reused by all consumers
+                            'ordinal': date_obj.toordinal(),  # Day number for integer date math
+                            'day_num': date_obj.day,
                             'name': name,
                             'day': day_of_week,
                             'month': date_obj.month,  # Add month for easier filtering
                             'year': date_obj.year  # Add year for easier filtering
                         })
-                    except ValueError:
+                    except (KeyError, ValueError):
                         logger.warning(f"Could not parse date: {date_str}")
                         continue
 
@@ -242,6 +363,30 @@ class HolidayScraper(QObject):
             return []
 
 
+class ScrapeWorkerSignals(QObject):
+    """Signals emitted by ScrapeWorker, QRunnable itself cannot define signals."""
+
+    finished = pyqtSignal(list)
+
+
+class ScrapeWorker(QRunnable):
+    """Runs HolidayScraper.scrape_holidays on a thread pool thread."""
+
+    def __init__(self, scraper: HolidayScraper):
+        super().__init__()
+        self.scraper = scraper
+        self.signals = ScrapeWorkerSignals()
+
+    def run(self) -> None:
+        """Scrape holidays and hand the result back to the GUI thread."""
+        try:
+            holidays = self.scraper.scrape_holidays()
+        except Exception as e:
+            logger.error(f"Holiday scrape worker failed: {str(e)}")
+            holidays = []
+        self.signals.finished.emit(holidays)
+
+
 class NotificationManager(QObject):
     """Class responsible for managing notifications."""
 
@@ -259,6 +404,22 @@ class NotificationManager(QObject):
         """
         self.main_window.add_notification(title, message)
 
+    def show_notifications(self, notifications: List[Tuple[str, str]]) -> None:
+        """
+        Show several notifications, combined into a single one if there is more than one.
+
+        Args:
+            notifications (List[Tuple[str, str]]): (title, message) pairs to show
+        """
+        if not notifications:
+            return
+        if len(notifications) == 1:
+            self.show_notification(*notifications[0])
+            return
+
+        message = "\n\n".join(f"{title}\n{message}" for title, message in notifications)
+        self.show_notification(f"{len(notifications)} Holidays Coming Up", message)
+
 
 class HolidayStorage(QObject):
     """Class responsible for storing and retrieving notified holidays."""
@@ -269,41 +430,66 @@ class HolidayStorage(QObject):
         app_dir = get_log_directory()
         self.notified_file = str(app_dir / file_name)
         self.notified_holidays = self.load_notified_holidays()
+        # Set when the in-memory holidays differ from the file, written on flush()
+        self.dirty = False
 
-    def load_notified_holidays(self) -> List[str]:
+    def load_notified_holidays(self) -> Set[str]:
         """
         Load previously notified holidays from file.
 
         Returns:
-            List[str]: List of notified holiday keys
+            Set[str]: Set of notified holiday keys
         """
         if os.path.exists(self.notified_file):
             try:
                 with open(self.notified_file, 'r') as f:
-                    return json.load(f)
+                    # Stored as a list on disk, kept as a set for O(1) lookups
+                    return set(json.load(f))
             except json.JSONDecodeError:
                 logger.error(f"Error decoding {self.notified_file}, starting with empty list")
-                return []
-        return []
+                return set()
+        return set()
 
     def save_notified_holidays(self) -> None:
         """Save notified holidays to file."""
         try:
-            with open(self.notified_file, 'w') as f:
-                json.dump(self.notified_holidays, f)
+            atomic_write_bytes(self.notified_file, dumps_json(sorted(self.notified_holidays)))
+            self.dirty = False
         except Exception as e:
             logger.error(f"Error saving notified holidays: {str(e)}")
 
+    def flush(self) -> None:
+        """Save notified holidays to file if they changed since the last save."""
+        if self.dirty:
+            self.save_notified_holidays()
+
     def add_holiday(self, holiday_key: str) -> None:
         """
-        Add a holiday to the notified list.
+        Add a holiday to the notified list. Call flush() to persist it.
 
         Args:
             holiday_key (str): Unique key for the holiday
         """
         if holiday_key not in self.notified_holidays:
-            self.notified_holidays.append(holiday_key)
-            self.save_notified_holidays()
+            self.notified_holidays.add(holiday_key)
+            self.dirty = True
+
+    def add_holidays(self, holiday_keys: List[str], keep_days: Optional[int] = None) -> None:
+        """
+        Add several holidays to the notified list and save the file at most once.
+
+        Args:
+            holiday_keys (List[str]): Unique keys for the holidays
+            keep_days (Optional[int]): If given, also drop notifications older than this
+                many days as part of the same write
+        """
+        before = len(self.notified_holidays)
+        self.notified_holidays.update(holiday_keys)
+        if len(self.notified_holidays) != before:
+            self.dirty = True
+        if keep_days is not None:
+            self.clean_old_notifications(keep_days)
+        self.flush()
 
     def is_notified(self, holiday_key: str) -> bool:
         """
@@ -319,25 +505,62 @@ class HolidayStorage(QObject):
 
     def clean_old_notifications(self, days: int = 60) -> None:
         """
-        Remove notifications older than specified days.
+        Remove notifications older than specified days. Call flush() to persist it.
 
         Args:
             days (int): Number of days to keep notifications
         """
         today = datetime.now().date()
-        cutoff_date = today - timedelta(days=days)
+        # Keys start with an ISO date, which compares correctly as a plain string
+        cutoff_iso = (today - timedelta(days=days)).isoformat()
 
-        self.notified_holidays = [
+        before = len(self.notified_holidays)
+        self.notified_holidays = {
             h for h in self.notified_holidays
-            if datetime.strptime(h.split('_')[0], '%Y-%m-%d').date() > cutoff_date
-        ]
-        self.save_notified_holidays()
+            if h[:10] > cutoff_iso
+        }
+        # Only persist if something was actually removed
+        if len(self.notified_holidays) != before:
+            self.dirty = True
 
 
 class HolidayNotifier(QMainWindow):
     """Main class for the holiday notification application."""
 
-    def __init__(self):
+    # Colors used to style holiday items, built once instead of per item
+    TODAY_BACKGROUND = QColor(255, 255, 200)  # Light yellow
+    TODAY_FOREGROUND = QColor(0, 0, 0)  # Black text
+    PAST_FOREGROUND = QColor(128, 128, 128)  # Gray text
+
+    # Notification title and message templates for holidays today, tomorrow and later
+    # within the week, indexed by min(days until the holiday, 2)
+    HOLIDAY_NOTIFICATIONS = (
+        ("Holiday Today! 🎉", "{name}\n{day}"),
+        ("Holiday Tomorrow! 📅", "{name}\n{day}"),
+        ("Upcoming Holiday in {days_until} days", "{name}\n{date} ({day})"),
+    )
+
+    # Log line, notification title and message for toggle_startup, keyed by
+    # (run on startup requested, change succeeded)
+    STARTUP_MESSAGES = {
+        (True, True): ("Added application to startup", "Startup Setting",
+                       "Application will now run on system startup"),
+        (True, False): ("Failed to add application to startup", "Startup Setting Error",
+                        "Failed to add application to startup"),
+        (False, True): ("Removed application from startup", "Startup Setting",
+                        "Application will no longer run on system startup"),
+        (False, False): ("Failed to remove application from startup", "Startup Setting Error",
+                         "Failed to remove application from startup"),
+    }
+
+    def __init__(self, show: bool = True):
+        """
+        Build the main window and start the holiday checks.
+
+        Args:
+            show (bool): Show the window and the welcome popup, False builds the window
+                without showing anything, as used by --self-test
+        """
         self.app = QApplication(sys.argv)
         super().__init__()
         
@@ -421,9 +644,7 @@ class HolidayNotifier(QMainWindow):
         
         # Add year selection dropdown
         self.year_selector = QComboBox()
-        current_year = datetime.now().year
-        self.year_selector.addItem(str(current_year))
-        self.year_selector.addItem(str(current_year + 1))
+        self.update_year_selector(datetime.now().year)
         self.year_selector.currentTextChanged.connect(self.update_yearly_holidays)
         yearly_header_layout.addWidget(self.year_selector)
         yearly_header_layout.addStretch()
@@ -492,32 +713,122 @@ class HolidayNotifier(QMainWindow):
         # Store holiday information
         self.next_holiday = None
         self.all_holidays = []
+        self._scrape_worker = None
+        # Holidays indexed by (year, month) and by year, each list sorted by date
+        self._by_year_month: Dict[Tuple[int, int], List[dict]] = {}
+        self._by_year: Dict[int, List[dict]] = {}
+        # all_holidays sorted by date, and their day ordinals in the same order
+        self._sorted_holidays: List[dict] = []
+        self._holiday_ordinals: List[int] = []
 
         # Timer to check holidays daily
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_holidays)
         self.timer.start(86400000)  # Check every 24 hours
 
-        # Timer to update next holiday info every minute
+        # Timer to update next holiday info, the countdown only changes at midnight so
+        # update_next_holiday_display re-arms it for the next day boundary each time
         self.update_timer = QTimer()
+        self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.update_next_holiday_display)
-        self.update_timer.start(60000)  # Update every minute
 
         # Check holidays on startup (after a short delay)
         QTimer.singleShot(2000, self.check_holidays)
 
-        # Show the window
-        self.show()
+        if show:
+            # Show the window
+            self.show()
+
+            # Show welcome popup after a short delay
+            QTimer.singleShot(500, self.show_welcome_popup)
+
+    def _index_holidays(self, holidays: List[dict]) -> None:
+        """
+        Bucket holidays by (year, month) and by year in a single pass.
+
+        Args:
+            holidays (List[dict]): Scraped holiday dictionaries
+        """
+        by_year_month = defaultdict(list)
+        by_year = defaultdict(list)
+        sorted_holidays = sorted(holidays, key=lambda h: h['ordinal'])
+        for holiday in sorted_holidays:
+            holiday_date = holiday['date_obj']
+            by_year_month[(holiday_date.year, holiday_date.month)].append(holiday)
+            by_year[holiday_date.year].append(holiday)
+        self._by_year_month = dict(by_year_month)
+        self._by_year = dict(by_year)
+
+        # Holidays in date order with their day ordinals as a sorted list, so the
+        # holidays of the coming week can be found by bisection
+        self._sorted_holidays = sorted_holidays
+        self._holiday_ordinals = [h['ordinal'] for h in sorted_holidays]
+
+    def update_year_selector(self, current_year: int) -> None:
+        """
+        Fill the year selector with the current and next year, keeping the selection.
+
+        Signals are blocked while filling so the yearly tree isn't rebuilt for every
+        intermediate item; callers refresh it once with update_yearly_holidays().
+
+        Args:
+            current_year (int): First year to offer
+        """
+        years = [str(current_year), str(current_year + 1)]
+        if [self.year_selector.itemText(i) for i in range(self.year_selector.count())] == years:
+            return
+
+        selected = self.year_selector.currentText()
+        with QSignalBlocker(self.year_selector):
+            self.year_selector.clear()
+            self.year_selector.addItems(years)
+            if selected in years:
+                self.year_selector.setCurrentText(selected)
+
+    def _holidays_for_month(self, year: int, month: int) -> List[dict]:
+        """
+        Get the holidays of a month from the index built by _index_holidays.
+
+        Args:
+            year (int): Year of the month
+            month (int): Month number (1-12)
 
-        # Show welcome popup after a short delay
-        QTimer.singleShot(500, self.show_welcome_popup)
+        Returns:
+            List[dict]: Holidays in that month, sorted by date
+        """
+        return self._by_year_month.get((year, month), [])
+
+    def _next_holiday_from(self, today_ord: int) -> Optional[dict]:
+        """
+        Get the first holiday on or after a day by bisecting the sorted holiday ordinals.
+
+        Args:
+            today_ord (int): Day ordinal to start from, see date.toordinal()
+
+        Returns:
+            Optional[dict]: The next holiday, or None if there is no later holiday
+        """
+        index = bisect.bisect_left(self._holiday_ordinals, today_ord)
+        if index < len(self._sorted_holidays):
+            return self._sorted_holidays[index]
+        return None
 
     def update_next_holiday_display(self) -> None:
-        """Update the next holiday display in the main window."""
+        """Update the next holiday display in the main window and schedule the next update."""
+        now = datetime.now()
+        today = now.date()
+        today_ord = today.toordinal()
+
+        # Move on to the following holiday once the current one has passed
+        if self.next_holiday and self.next_holiday['ordinal'] < today_ord:
+            self.next_holiday = self._next_holiday_from(today_ord)
+
+        # Refresh again just after the next day boundary
+        next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        self.update_timer.start(int((next_midnight - now).total_seconds() * 1000) + 1000)
+
         if self.next_holiday:
-            holiday_date = datetime.strptime(self.next_holiday['date'], '%Y-%m-%d').date()
-            today = datetime.now().date()
-            days_until = (holiday_date - today).days
+            days_until = self.next_holiday['ordinal'] - today_ord
 
             if days_until == 0:
                 display_text = f"Today is a Holiday! 🎉\n{self.next_holiday['name']} ({self.next_holiday['day']})"
@@ -559,24 +870,20 @@ class HolidayNotifier(QMainWindow):
 
         # If we have holidays for this month, include them in the welcome message
         if hasattr(self, 'all_holidays') and self.all_holidays:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-            current_month_name = datetime.now().strftime('%B')
-
-            this_month_holidays = []
-            for holiday in self.all_holidays:
-                holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d')
-                if holiday_date.month == current_month and holiday_date.year == current_year:
-                    this_month_holidays.append(holiday)
+            now = datetime.now()
+            current_month = now.month
+            current_year = now.year
+            current_month_name = now.strftime('%B')
 
-            # Sort by day
-            this_month_holidays.sort(key=lambda x: datetime.strptime(x['date'], '%Y-%m-%d').day)
+            # Already sorted by day
+            this_month_holidays = self._holidays_for_month(current_year, current_month)
 
             if this_month_holidays:
                 holiday_info = f"{app_info}Holidays in {current_month_name} {current_year}:\n"
                 for holiday in this_month_holidays:
-                    holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d')
-                    holiday_info += f"• {holiday_date.day} {current_month_name}: {holiday['name']}\n"
+                    holiday_info += (
+                        f"• {holiday['day_num']} {current_month_name}: {holiday['name']}\n"
+                    )
                 welcome_box.setInformativeText(holiday_info)
             else:
                 welcome_box.setInformativeText(f"{app_info}No holidays found for {current_month_name} {current_year}.")
@@ -587,43 +894,52 @@ class HolidayNotifier(QMainWindow):
 
     def update_monthly_holidays(self) -> None:
         """Update the monthly holidays list."""
+        widget = self.monthly_holidays_list
+        # Suspend repaints and signals so the list is relaid out once, not per insert
+        widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(widget):
+                self._populate_monthly_holidays()
+        finally:
+            widget.setUpdatesEnabled(True)
+            widget.update()
+
+    def _populate_monthly_holidays(self) -> None:
+        """Fill the monthly holidays list, called with list updates disabled."""
         self.monthly_holidays_list.clear()
 
         if not self.all_holidays:
             self.monthly_holidays_list.addItem("No holidays found. Click 'Check Holidays Now' to fetch data.")
             return
 
-        current_month = datetime.now().month
-        current_month_name = datetime.now().strftime('%B')
-        current_year = datetime.now().year
-
-        # Find holidays for the current month in the current year
-        this_month_holidays = []
-        for holiday in self.all_holidays:
-            holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d')
-            if holiday_date.month == current_month and holiday_date.year == current_year:
-                this_month_holidays.append(holiday)
+        # Read the clock once so every comparison below sees the same day
+        now = datetime.now()
+        today = now.date()
+        current_month = now.month
+        current_month_name = now.strftime('%B')
+        current_year = now.year
 
-        # Sort by day
-        this_month_holidays.sort(key=lambda x: datetime.strptime(x['date'], '%Y-%m-%d').day)
+        # Holidays for the current month in the current year, already sorted by day
+        this_month_holidays = self._holidays_for_month(current_year, current_month)
 
         if this_month_holidays:
+            bold_font = QFont()
+            bold_font.setBold(True)
+
             for holiday in this_month_holidays:
-                holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d')
+                holiday_date = holiday['date_obj']
                 item_text = f"{holiday_date.day} {current_month_name}: {holiday['name']} ({holiday['day']})"
 
                 item = QListWidgetItem(item_text)
 
                 # Highlight today's holiday
-                if holiday_date.date() == datetime.now().date():
-                    item.setBackground(QColor(255, 255, 200))  # Light yellow
-                    item.setForeground(QColor(0, 0, 0))  # Black text
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+                if holiday_date == today:
+                    item.setBackground(self.TODAY_BACKGROUND)
+                    item.setForeground(self.TODAY_FOREGROUND)
+                    item.setFont(bold_font)
                 # Past holidays in gray
-                elif holiday_date.date() < datetime.now().date():
-                    item.setForeground(QColor(128, 128, 128))  # Gray text
+                elif holiday_date < today:
+                    item.setForeground(self.PAST_FOREGROUND)
 
                 self.monthly_holidays_list.addItem(item)
         else:
@@ -631,6 +947,18 @@ class HolidayNotifier(QMainWindow):
             
     def update_yearly_holidays(self) -> None:
         """Update the yearly holidays tree with holidays for the selected year."""
+        tree = self.yearly_holidays_tree
+        # Suspend repaints and signals so the tree is relaid out once, not per insert
+        tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(tree):
+                self._populate_yearly_holidays()
+        finally:
+            tree.setUpdatesEnabled(True)
+            tree.update()
+
+    def _populate_yearly_holidays(self) -> None:
+        """Fill the yearly holidays tree, called with tree updates disabled."""
         self.yearly_holidays_tree.clear()
         
         if not self.all_holidays:
@@ -639,67 +967,78 @@ class HolidayNotifier(QMainWindow):
         # Get selected year
         selected_year = int(self.year_selector.currentText())
         
-        # Dictionary to store month nodes
-        month_nodes = {}
-        
         # Month names
         month_names = [
             "January", "February", "March", "April", "May", "June",
             "July", "August", "September", "October", "November", "December"
         ]
         
-        # Create month nodes
-        for month_num, month_name in enumerate(month_names, 1):
-            month_node = QTreeWidgetItem(self.yearly_holidays_tree)
-            month_node.setText(0, month_name)
-            month_node.setExpanded(True)  # Expand all months by default
-            month_nodes[month_num] = month_node
-        
-        # Filter holidays for the selected year
-        year_holidays = [h for h in self.all_holidays if datetime.strptime(h['date'], '%Y-%m-%d').year == selected_year]
+        # Holidays for the selected year, already sorted by date
+        year_holidays = self._by_year.get(selected_year, [])
         
         today = datetime.now().date()
+        bold_font = QFont()
+        bold_font.setBold(True)
         
-        # Add holidays to their respective months
+        # Build the holiday items for each month before touching the tree
+        month_children = defaultdict(list)
         for holiday in year_holidays:
-            holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d')
+            holiday_date = holiday['date_obj']
             month_num = holiday_date.month
             
-            if month_num in month_nodes:
-                holiday_item = QTreeWidgetItem(month_nodes[month_num])
-                
-                # Format as "DD Month: Holiday Name (Day)"
-                date_str = f"{holiday_date.day:02d} {month_names[month_num-1]}"
-                
-                holiday_item.setText(0, date_str)
-                holiday_item.setText(1, holiday['name'])
-                holiday_item.setText(2, holiday['day'])
-                
-                # Highlight today's holiday
-                if holiday_date.date() == today:
-                    for col in range(3):  # Apply to all columns
-                        holiday_item.setBackground(col, QColor(255, 255, 200))  # Light yellow
-                        font = holiday_item.font(col)
-                        font.setBold(True)
-                        holiday_item.setFont(col, font)
-                # Past holidays in gray
-                elif holiday_date.date() < today:
-                    for col in range(3):  # Apply to all columns
-                        holiday_item.setForeground(col, QColor(128, 128, 128))  # Gray text
+            # Format as "DD Month: Holiday Name (Day)"
+            date_str = f"{holiday_date.day:02d} {month_names[month_num-1]}"
+            
+            holiday_item = QTreeWidgetItem([date_str, holiday['name'], holiday['day']])
+            
+            # Highlight today's holiday
+            if holiday_date == today:
+                for col in range(3):  # Apply to all columns
+                    holiday_item.setBackground(col, self.TODAY_BACKGROUND)
+                    holiday_item.setFont(col, bold_font)
+            # Past holidays in gray
+            elif holiday_date < today:
+                for col in range(3):  # Apply to all columns
+                    holiday_item.setForeground(col, self.PAST_FOREGROUND)
+            
+            month_children[month_num].append(holiday_item)
         
-        # Remove empty months
-        for month_num, month_node in list(month_nodes.items()):
-            if month_node.childCount() == 0:
-                index = self.yearly_holidays_tree.indexOfTopLevelItem(month_node)
-                self.yearly_holidays_tree.takeTopLevelItem(index)
+        # Create month nodes only for months that have holidays, in calendar order
+        month_nodes = []
+        for month_num in sorted(month_children):
+            month_node = QTreeWidgetItem([month_names[month_num-1]])
+            month_node.addChildren(month_children[month_num])
+            month_nodes.append(month_node)
+        
+        self.yearly_holidays_tree.addTopLevelItems(month_nodes)
+        self.yearly_holidays_tree.expandAll()  # Expand all months by default
 
     def check_holidays(self) -> None:
-        """Check for holidays and show notifications."""
+        """Start checking for holidays in the background, see _on_scrape_complete."""
+        # The daily timer can fire while a check is still running, never run two at once
+        if self._scrape_worker is not None:
+            logger.info("Holiday check already in progress")
+            return
+
         logger.info("Checking for holidays...")
         self.check_button.setEnabled(False)
         self.check_button.setText("Checking...")
 
-        holidays = self.scraper.scrape_holidays()
+        # Scrape off the GUI thread so the window stays responsive during the requests
+        worker = ScrapeWorker(self.scraper)
+        worker.signals.finished.connect(self._on_scrape_complete)
+        self._scrape_worker = worker  # Keep the signals object alive until the result arrives
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_scrape_complete(self, holidays: list) -> None:
+        """
+        Process scraped holidays and show notifications, runs on the GUI thread.
+
+        Args:
+            holidays (list): Holiday dictionaries returned by the scraper
+        """
+        self._scrape_worker = None
+
         if not holidays:
             logger.warning("No holidays found or error occurred")
             self.add_notification("Warning", "No holidays found or error occurred")
@@ -707,110 +1046,91 @@ class HolidayNotifier(QMainWindow):
             self.check_button.setText("Check Holidays Now")
             return
 
-        # Store all holidays
-        self.all_holidays = holidays
+        # Store all holidays, re-indexing only when the scraped list actually changed
+        if holidays != self.all_holidays:
+            self.all_holidays = holidays
+            self._index_holidays(holidays)
 
-        today = datetime.now().date()
-        tomorrow = today + timedelta(days=1)
-        week_ahead = today + timedelta(days=7)
-
-        # Find next upcoming holiday
-        upcoming_holidays = []
-        for holiday in holidays:
-            holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d').date()
-            if holiday_date >= today:
-                upcoming_holidays.append(holiday)
-
-        # Sort upcoming holidays by date
-        upcoming_holidays.sort(key=lambda x: datetime.strptime(x['date'], '%Y-%m-%d'))
-
-        # Set next holiday if available
-        if upcoming_holidays:
-            self.next_holiday = upcoming_holidays[0]
-            self.update_next_holiday_display()
-        else:
-            self.next_holiday = None
-            self.next_holiday_label.setText("No upcoming holidays found")
+        today_ord = datetime.now().date().toordinal()
+
+        # Bisect the sorted ordinals for the holidays from today up to a week ahead
+        start = bisect.bisect_left(self._holiday_ordinals, today_ord)
+        end = bisect.bisect_right(self._holiday_ordinals, today_ord + 7)
 
-        # Update monthly and yearly holidays displays
+        # Set next upcoming holiday if available
+        self.next_holiday = self._next_holiday_from(today_ord)
+        self.update_next_holiday_display()
+
+        # Follow a year rollover picked up by the scraper, then refresh the displays once
+        self.update_year_selector(self.scraper.current_year)
         self.update_monthly_holidays()
         self.update_yearly_holidays()
 
-        for holiday in holidays:
-            holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d').date()
+        # Only the holidays of the coming week are visited, on most days there are none
+        notifications = []
+        notified_keys = []
+        for holiday in self._sorted_holidays[start:end]:
             holiday_key = f"{holiday['date']}_{holiday['name']}"
 
             # Skip if already notified
             if self.storage.is_notified(holiday_key):
                 continue
 
-            # Check if holiday is today
-            if holiday_date == today:
-                self.notification_manager.show_notification(
-                    "Holiday Today! 🎉",
-                    f"{holiday['name']}\n{holiday['day']}"
-                )
-                self.storage.add_holiday(holiday_key)
+            days_until = holiday['ordinal'] - today_ord
+            title, message = self.HOLIDAY_NOTIFICATIONS[min(days_until, 2)]
+            notifications.append((
+                title.format(days_until=days_until),
+                message.format(**holiday)
+            ))
+            notified_keys.append(holiday_key)
 
-            # Check if holiday is tomorrow
-            elif holiday_date == tomorrow:
-                self.notification_manager.show_notification(
-                    "Holiday Tomorrow! 📅",
-                    f"{holiday['name']}\n{holiday['day']}"
-                )
-                self.storage.add_holiday(holiday_key)
-
-            # Check if holiday is within a week
-            elif today < holiday_date <= week_ahead:
-                days_until = (holiday_date - today).days
-                self.notification_manager.show_notification(
-                    f"Upcoming Holiday in {days_until} days",
-                    f"{holiday['name']}\n{holiday['date']} ({holiday['day']})"
-                )
-                self.storage.add_holiday(holiday_key)
+        # Several holidays found in the same check are shown as one notification
+        self.notification_manager.show_notifications(notifications)
 
-        # Clean up old notified holidays
-        self.storage.clean_old_notifications()
+        # Record the notified holidays and clean up old ones with a single write
+        self.storage.add_holidays(notified_keys, keep_days=60)
 
         self.check_button.setEnabled(True)
         self.check_button.setText("Check Holidays Now")
 
+    def _apply_startup(self, desired: bool) -> bool:
+        """
+        Add the application to or remove it from startup.
+
+        Args:
+            desired (bool): True to run on startup, False to stop running on startup
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if desired:
+            return self.startup_manager.add_to_startup()
+        return self.startup_manager.remove_from_startup()
+
     def toggle_startup(self, state) -> None:
         """Toggle application startup status.
         
         Args:
             state: Checkbox state (Qt.Checked or Qt.Unchecked)
         """
-        if state == Qt.Checked:
-            success = self.startup_manager.add_to_startup()
-            if success:
-                logger.info("Added application to startup")
-                self.config_manager.set_setting("run_on_startup", True)
-                self.add_notification("Startup Setting", "Application will now run on system startup")
-            else:
-                logger.error("Failed to add application to startup")
-                self.add_notification("Startup Setting Error", "Failed to add application to startup")
-                # Reset checkbox without triggering the event
-                self.startup_checkbox.blockSignals(True)
-                self.startup_checkbox.setChecked(False)
-                self.startup_checkbox.blockSignals(False)
+        desired = state == Qt.Checked
+        success = self._apply_startup(desired)
+        log_message, title, message = self.STARTUP_MESSAGES[(desired, success)]
+
+        if success:
+            logger.info(log_message)
+            self.config_manager.set_setting("run_on_startup", desired)
         else:
-            success = self.startup_manager.remove_from_startup()
-            if success:
-                logger.info("Removed application from startup")
-                self.config_manager.set_setting("run_on_startup", False)
-                self.add_notification("Startup Setting", "Application will no longer run on system startup")
-            else:
-                logger.error("Failed to remove application from startup")
-                self.add_notification("Startup Setting Error", "Failed to remove application from startup")
-                # Reset checkbox without triggering the event
-                self.startup_checkbox.blockSignals(True)
-                self.startup_checkbox.setChecked(True)
-                self.startup_checkbox.blockSignals(False)
+            logger.error(log_message)
+            # Reset checkbox without triggering the event
+            with QSignalBlocker(self.startup_checkbox):
+                self.startup_checkbox.setChecked(not desired)
+        self.add_notification(title, message)
 
     def quit_app(self) -> None:
         """Quit the application."""
         logger.info("Application shutting down")
+        self.startup_manager.close()
         self.app.quit()
 
     def run(self) -> None:
@@ -820,5 +1140,15 @@ class HolidayNotifier(QMainWindow):
 
 
 if __name__ == "__main__":
+    if "--self-test" in sys.argv[1:]:
+        # Building the window exercises the imports, resources and storage. The result is
+        # reported through the exit code only, a windowed build has no stdout
+        try:
+            HolidayNotifier(show=False)
+        except Exception as e:
+            logger.error(f"Self-test failed: {str(e)}")
+            sys.exit(SELF_TEST_FAILED)
+        sys.exit(0)
+
     notifier = HolidayNotifier()
     notifier.run()
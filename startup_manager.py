@@ -7,14 +7,20 @@ Handles adding/removing the application from Windows startup.
 """
 
 import os
+import subprocess
 import sys
 import logging
+import threading
 import winreg
 from typing import Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Return codes of the Windows registry API
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+
 
 class StartupManager:
     """Class responsible for managing application startup settings."""
@@ -28,26 +34,114 @@ class StartupManager:
         """
         self.app_name = app_name
         self.reg_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
+        # Command registered for startup, it can't change while the process runs
+        self._app_path = self._resolve_app_path()
+        # Last known startup state, None until the registry has been read
+        self._cached_state: Optional[bool] = None
+        # Run key handles, each opened on first use and kept until close(). Queries use
+        # the read-only handle so they still work where the key is write-protected
+        self._read_key = None
+        self._write_key = None
+        # Serializes access to the shared key handle and cached state
+        self._lock = threading.RLock()
+
+    def _get_run_key(self, write: bool = False):
+        """
+        Get a Run registry key handle, opening it on the first call.
+
+        Args:
+            write (bool): Get the handle opened with write access in addition to read access
+
+        Returns:
+            winreg.HKEYType: Open key handle
+        """
+        if write:
+            if self._write_key is None:
+                self._write_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.reg_key, 0,
+                                                 winreg.KEY_READ | winreg.KEY_WRITE)
+            return self._write_key
+
+        if self._read_key is None:
+            self._read_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.reg_key, 0,
+                                            winreg.KEY_READ)
+        return self._read_key
+
+    def close(self) -> None:
+        """Close the Run key handles."""
+        with self._lock:
+            for key in (self._read_key, self._write_key):
+                if key is not None:
+                    key.Close()
+            self._read_key = None
+            self._write_key = None
+
+    def _resolve_app_path(self) -> str:
+        """
+        Get the command to register for startup, quoted when the path needs it.
+
+        Returns:
+            str: Path to the executable or startup batch file
+        """
+        if getattr(sys, 'frozen', False):
+            # If the application is frozen (PyInstaller)
+            app_path = sys.executable
+        else:
+            # If running as a script, use the batch file
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            app_path = os.path.join(script_dir, "start_notifier.bat")
+        return subprocess.list2cmdline([app_path])
+
+    def _value_exists(self, key) -> bool:
+        """
+        Check whether the startup value exists in the Run key.
+
+        RegQueryValueExW is called directly without a data buffer since only the return
+        code is needed, winreg.QueryValueEx would also read and convert the value.
+
+        Args:
+            key (winreg.HKEYType): Open Run key handle
+
+        Returns:
+            bool: True if the value exists, False otherwise
+        """
+        # Imported here so ctypes is only loaded when the registry is actually read
+        import ctypes
+
+        result = ctypes.windll.advapi32.RegQueryValueExW(
+            ctypes.c_void_p(int(key)), self.app_name, None, None, None, None
+        )
+        if result == ERROR_FILE_NOT_FOUND:
+            return False
+        if result != ERROR_SUCCESS:
+            raise ctypes.WinError(result)
+        return True
 
     def is_in_startup(self) -> bool:
         """
         Check if the application is set to run on startup.
 
+        The registry is only read on the first call, later calls return the cached state
+        which add_to_startup() and remove_from_startup() keep up to date. The Run key is
+        not watched for outside changes, the state is only needed once when the window
+        is built.
+
         Returns:
             bool: True if in startup, False otherwise
         """
-        try:
-            # Open the registry key
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.reg_key) as key:
-                # Try to get the value, if it exists
-                winreg.QueryValueEx(key, self.app_name)
-                return True
-        except FileNotFoundError:
-            # Registry key doesn't exist
-            return False
-        except WindowsError:
-            # Registry value doesn't exist
-            return False
+        with self._lock:
+            if self._cached_state is not None:
+                return self._cached_state
+
+            try:
+                self._cached_state = self._value_exists(self._get_run_key())
+            except FileNotFoundError:
+                # Registry key doesn't exist
+                self._cached_state = False
+            except WindowsError as e:
+                # The state is unknown, report it and read again on the next call
+                logger.error(f"Failed to read startup setting: {str(e)}")
+                return False
+            return self._cached_state
 
     def add_to_startup(self) -> bool:
         """
@@ -57,21 +151,14 @@ class StartupManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Get the full path to the executable or script
-            if getattr(sys, 'frozen', False):
-                # If the application is frozen (PyInstaller)
-                app_path = f'"{sys.executable}"'
-            else:
-                # If running as a script, use the batch file
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                batch_path = os.path.join(script_dir, "start_notifier.bat")
-                app_path = f'"{batch_path}"'
-
-            # Open the registry key
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.reg_key, 0, 
-                               winreg.KEY_WRITE) as key:
+            # Full path to the executable or script
+            app_path = self._app_path
+
+            with self._lock:
                 # Set the value
-                winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, app_path)
+                winreg.SetValueEx(self._get_run_key(write=True), self.app_name, 0,
+                                  winreg.REG_SZ, app_path)
+                self._cached_state = True
             
             logger.info(f"Added {self.app_name} to startup with path: {app_path}")
             return True
@@ -87,16 +174,15 @@ class StartupManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Check if the application is in startup
-            if not self.is_in_startup():
-                logger.info(f"{self.app_name} is not in startup")
-                return True
-
-            # Open the registry key
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.reg_key, 0, 
-                               winreg.KEY_WRITE) as key:
-                # Delete the value
-                winreg.DeleteValue(key, self.app_name)
+            with self._lock:
+                try:
+                    # Delete the value, a missing value means there is nothing to remove
+                    winreg.DeleteValue(self._get_run_key(write=True), self.app_name)
+                except FileNotFoundError:
+                    logger.info(f"{self.app_name} is not in startup")
+                    self._cached_state = False
+                    return True
+                self._cached_state = False
             
             logger.info(f"Removed {self.app_name} from startup")
             return True
@@ -108,12 +194,23 @@ class StartupManager:
         """
         Toggle the startup status.
 
+        The presence of the value is checked and changed on the same key handle.
+
         Returns:
             bool: New startup status (True if added, False if removed)
         """
-        if self.is_in_startup():
-            self.remove_from_startup()
-            return False
-        else:
-            self.add_to_startup()
-            return True
+        with self._lock:
+            try:
+                key = self._get_run_key(write=True)
+                in_startup = self._value_exists(key)
+
+                if in_startup:
+                    winreg.DeleteValue(key, self.app_name)
+                    logger.info(f"Removed {self.app_name} from startup")
+                else:
+                    winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, self._app_path)
+                    logger.info(f"Added {self.app_name} to startup with path: {self._app_path}")
+                self._cached_state = not in_startup
+            except Exception as e:
+                logger.error(f"Failed to toggle startup: {str(e)}")
+            return bool(self._cached_state)
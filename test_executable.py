@@ -9,7 +9,6 @@ This script checks if the executable was built correctly and can run
 import os
 import subprocess
 import sys
-import time
 from pathlib import Path
 
 def test_executable():
@@ -29,33 +28,30 @@ def test_executable():
         return False
     
     print(f"Found executable at {exe_path}")
-    print("Starting the executable to test it...")
+    print("Running the executable's self-test...")
     
     try:
-        # Start the executable
-        process = subprocess.Popen([str(exe_path)])
+        # Run without a console attached, the flags only exist on Windows
+        creationflags = (getattr(subprocess, "DETACHED_PROCESS", 0)
+                         | getattr(subprocess, "CREATE_NO_WINDOW", 0))
         
-        # Wait for a few seconds to see if it starts correctly
-        print("Waiting for 5 seconds to check if the application starts...")
-        time.sleep(5)
+        # The self-test builds the main window without showing it and exits with 0 on
+        # success, the exit code is used since a windowed build has no stdout
+        result = subprocess.run([str(exe_path), "--self-test"], timeout=10, capture_output=True,
+                                creationflags=creationflags, close_fds=True)
         
-        # Check if process is still running
-        if process.poll() is None:
-            print("Success! The executable is running correctly.")
-            
-            # Ask user if they want to close the application
-            response = input("Do you want to close the application now? (y/n): ")
-            if response.lower() == 'y':
-                process.terminate()
-                print("Application terminated.")
-            else:
-                print("Application will continue running.")
-            
+        if result.returncode == 0:
+            print("Success! The executable starts correctly.")
             return True
         else:
-            print("Error: The executable started but terminated unexpectedly.")
+            print(f"Error: The self-test failed (exit code {result.returncode}).")
+            if result.stderr:
+                print(result.stderr.decode(errors="replace"))
             return False
     
+    except subprocess.TimeoutExpired:
+        print("Error: The self-test did not finish within 10 seconds.")
+        return False
     except Exception as e:
         print(f"Error testing executable: {e}")
         return False